@@ -0,0 +1,178 @@
+import logging
+import re
+from logging.handlers import SMTPHandler
+from pathlib import Path
+
+# Plain %-style fields this package's formatters use, e.g. %(name)s or
+# %(lineno)d. Anything fancier (padding, precision, %-literals) makes
+# FastFormatter fall back to the stock implementation.
+_FMT_FIELD = re.compile(r"%\((\w+)\)([sd])")
+
+
+class FastFormatter(logging.Formatter):
+    """
+    A `Formatter` that precompiles its %-style format string.
+
+    The stock `Formatter.format` re-applies `fmt % record.__dict__` on every
+    record, which re-parses the template string each time. This subclass
+    parses the format once in `__init__` into a list of (literal, attribute,
+    conversion) ops and formats a record by joining the literals with direct
+    attribute lookups — no template parsing, no `__dict__` materialization.
+    `%(field)d` fields are truncated to int to match `%`-formatting. Format
+    strings using features beyond plain `%(field)s` / `%(field)d` fields
+    (padding, precision, `%%` literals) fall back to the stock path, as do
+    records carrying exception or stack info.
+    """
+
+    def __init__(self, fmt: str | None = None, datefmt: str | None = None):
+        super().__init__(fmt=fmt, datefmt=datefmt)
+        self._ops: list[tuple[str, str | None, bool]] | None = None
+        if fmt is None or "%%" in fmt:
+            return
+        ops: list[tuple[str, str | None, bool]] = []
+        position = 0
+        for match in _FMT_FIELD.finditer(fmt):
+            ops.append(
+                (fmt[position : match.start()], match.group(1), match.group(2) == "d")
+            )
+            position = match.end()
+        remainder = fmt[position:]
+        if "%" in remainder or any("%" in literal for literal, _, _ in ops):
+            # Unsupported conversion left over; use the stock formatter.
+            return
+        if remainder:
+            ops.append((remainder, None, False))
+        self._ops = ops
+        self._uses_time = any(attr == "asctime" for _, attr, _ in ops)
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self._ops is None or record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        parts: list[str] = []
+        append = parts.append
+        for literal, attr, is_int in self._ops:
+            if literal:
+                append(literal)
+            if attr is not None:
+                value = getattr(record, attr)
+                if is_int:
+                    # Real %d semantics: floats like record.created truncate.
+                    append(str(int(value)))
+                else:
+                    append(value if type(value) is str else str(value))
+        return "".join(parts)
+
+
+# Shared formatter singletons: the logger constructors in this package all use
+# these format strings, so parse each one once at import instead of once per
+# handler per construction.
+STD_FORMATTER = FastFormatter(
+    fmt="%(asctime)s - app_name: %(name)s - %(levelname)s - %(message)s"
+)
+EMAIL_FORMATTER = FastFormatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(pathname)s:%(lineno)d"
+)
+
+# Log directories already created by make_file_handler. mkdir(parents=True,
+# exist_ok=True) still stats/mkdirs every component of the path, so repeated
+# handler construction into the same directory skips the walk entirely.
+_CREATED_DIRS: set[str] = set()
+
+
+def make_console_handler(
+    level: int, formatter: logging.Formatter = STD_FORMATTER
+) -> logging.StreamHandler:
+    """Build a console handler with the shared formatter.
+
+    Args:
+        level (int): Log level for the handler.
+        formatter (logging.Formatter, optional): Formatter to attach. Defaults
+            to the shared standard formatter.
+
+    Returns:
+        logging.StreamHandler: The configured handler.
+    """
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(level=level)
+    console_handler.setFormatter(fmt=formatter)
+    return console_handler
+
+
+def make_file_handler(
+    path: str | Path,
+    level: int,
+    formatter: logging.Formatter = STD_FORMATTER,
+    handler_factory: type[logging.FileHandler] = logging.FileHandler,
+    **handler_kwargs,
+) -> logging.FileHandler:
+    """Build a file handler with the shared formatter, creating the parent directory.
+
+    Args:
+        path (str | Path): Path to the log file.
+        level (int): Log level for the handler.
+        formatter (logging.Formatter, optional): Formatter to attach. Defaults
+            to the shared standard formatter.
+        handler_factory (type[logging.FileHandler], optional): The handler
+            class to instantiate, e.g. a rotating or buffered variant.
+            Defaults to `logging.FileHandler`.
+        **handler_kwargs: Extra keyword arguments for the handler class, e.g.
+            `maxBytes` and `backupCount` for rotating handlers.
+
+    Returns:
+        logging.FileHandler: The configured handler.
+    """
+    log_file_path = Path(path)
+    parent = str(log_file_path.parent)
+    if parent not in _CREATED_DIRS:
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(parent)
+    file_handler = handler_factory(log_file_path, **handler_kwargs)
+    file_handler.setLevel(level=level)
+    file_handler.setFormatter(fmt=formatter)
+    return file_handler
+
+
+def make_smtp_handler(
+    smtp_host: str,
+    smtp_port: int,
+    smtp_user: str,
+    smtp_password: str,
+    email_to: str | list[str],
+    email_subject: str,
+    formatter: logging.Formatter = EMAIL_FORMATTER,
+    level: int = logging.CRITICAL,
+    handler_factory: type[SMTPHandler] = SMTPHandler,
+) -> SMTPHandler:
+    """Build an SMTP handler with the shared formatter.
+
+    Args:
+        smtp_host (str): SMTP server host.
+        smtp_port (int): SMTP server port.
+        smtp_user (str): SMTP username, also used as the sender address.
+        smtp_password (str): SMTP password.
+        email_to (str | list[str]): Recipient address(es).
+        email_subject (str): Subject for the emails.
+        formatter (logging.Formatter, optional): Formatter to attach. Defaults
+            to the shared email formatter.
+        level (int, optional): Log level for the handler. Defaults to CRITICAL.
+        handler_factory (type[SMTPHandler], optional): The handler class to
+            instantiate, resolved at the call site so callers (and tests)
+            can substitute their own. Defaults to `SMTPHandler`.
+
+    Returns:
+        SMTPHandler: The configured handler.
+    """
+    email_handler = handler_factory(
+        mailhost=(smtp_host, smtp_port),
+        fromaddr=smtp_user,
+        toaddrs=email_to,
+        subject=email_subject,
+        credentials=(smtp_user, smtp_password),
+        secure=(),
+    )
+    email_handler.setLevel(level=level)
+    email_handler.setFormatter(fmt=formatter)
+    return email_handler
@@ -1,6 +1,65 @@
-import smtplib
-from email.mime.text import MIMEText
+from __future__ import annotations
+
+import threading
 from datetime import datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import smtplib
+
+# smtplib and email.mime.text are imported lazily inside the functions below:
+# they pull in ssl, socket and the email package, which is a noticeable chunk
+# of cold-start time and memory for code that only runs on a crash.
+
+_SMTP_HOST = "smtp.gmail.com"
+_SMTP_PORT = 587
+
+# Cache of authenticated SMTP connections keyed on (sender, host), so repeated
+# crash reports reuse one TCP+STARTTLS+AUTH handshake instead of paying it per
+# email. Guarded by _smtp_cache_lock for thread safety.
+_smtp_cache: dict[tuple[str, str], smtplib.SMTP] = {}
+_smtp_cache_lock = threading.Lock()
+
+
+def _get_smtp_connection(sender: str, password: str) -> smtplib.SMTP:
+    """Return a cached, authenticated SMTP connection, reconnecting if stale.
+
+    Args:
+        sender (str): The email address used to authenticate with the server.
+        password (str): The password or app-specific password for the sender.
+
+    Returns:
+        smtplib.SMTP: A connected, TLS-secured, logged-in SMTP session.
+
+    Notes:
+        - A cached connection is verified with `noop()` before reuse; if the
+          server has dropped it in the meantime, it is discarded and a fresh
+          connection is opened and cached.
+        - Callers must hold `_smtp_cache_lock` while using the returned
+          connection.
+    """
+    import smtplib
+
+    key = (sender, _SMTP_HOST)
+    server = _smtp_cache.get(key)
+
+    if server is not None:
+        try:
+            server.noop()
+            return server
+        except Exception:
+            _smtp_cache.pop(key, None)
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    server = smtplib.SMTP(host=_SMTP_HOST, port=_SMTP_PORT)
+    server.starttls()
+    server.login(user=sender, password=password)
+    _smtp_cache[key] = server
+    return server
+
 
 def send_crash_email(error_message: str, sender: str, receivers: list[str], password: str, app_name: str):
     """Sends an email notification when an application crashes.
@@ -19,7 +78,11 @@ def send_crash_email(error_message: str, sender: str, receivers: list[str], pass
         - Uses Gmail's SMTP server (smtp.gmail.com:587) with TLS encryption.
         - Requires the sender's email to allow less secure apps or an app-specific password.
         - Includes a timestamp in the format 'YYYY-MM-DD HH-MM-SS' in the subject and body.
+        - The SMTP connection is cached per sender and reused across calls, so
+          only the first email pays for the connection handshake and login.
     """
+    from email.mime.text import MIMEText
+
     timestamp = datetime.now().strftime('%Y-%m-%d %H-%M-%S')
     msg = MIMEText(f"{app_name} crashed with error:\n\n{error_message} on {timestamp}")
     msg["Subject"] = f"{app_name} crashed on {timestamp}"
@@ -27,9 +90,8 @@ def send_crash_email(error_message: str, sender: str, receivers: list[str], pass
     msg["To"] = ", ".join(receivers)
 
     try:
-        with smtplib.SMTP(host='smtp.gmail.com', port=587) as server:
-            server.starttls()
-            server.login(user=sender, password=password)
+        with _smtp_cache_lock:
+            server = _get_smtp_connection(sender=sender, password=password)
             server.sendmail(from_addr=sender, to_addrs=receivers, msg=msg.as_string())
     except Exception as e:
-        print(f"Failed to send email: {e}")
\ No newline at end of file
+        print(f"Failed to send email: {e}")
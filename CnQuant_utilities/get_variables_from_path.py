@@ -1,10 +1,16 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Accepted spellings for boolean environment variables, built once at import
+# so each lookup is a single O(1) hash probe.
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+
 class EnvironmentVariableNotFoundError(Exception):
     """Custom exception raised when a required environment variable is not found."""
-    
+
     def __init__(self, variable_name: str, message: str = ""):
         self.variable_name = variable_name
         self.message = message or f"Environment variable '{variable_name}' not found."
@@ -15,36 +21,64 @@ def get_log_directory(env_variable: str):
     Retrieve the log directory path from a specified environment variable.
 
     This function looks up an environment variable by name, checks if it's set,
-    verifies if the path exists, and returns it as a `Path` object. If the 
+    verifies if the path exists, and returns it as a `Path` object. If the
     environment variable is not set, it defaults to the current directory (".").
-    If the path specified by the environment variable does not exist, it raises 
+    If the path specified by the environment variable does not exist, it raises
     a `ValueError`.
 
     Args:
-        env_variable (str): The name of the environment variable to look up for 
+        env_variable (str): The name of the environment variable to look up for
                             the log directory path.
 
     Returns:
-        Path: A `Path` object representing the directory where logs should be 
+        Path: A `Path` object representing the directory where logs should be
               stored, either from the environment variable or the current directory.
 
     Raises:
         ValueError: If the environment variable is set but the path does not exist.
 
     Note:
-        - This function does not create the directory if it doesn't exist; it only 
+        - This function does not create the directory if it doesn't exist; it only
           checks for its existence.
-        - The current directory is used as a fallback when the environment variable 
+        - The current directory is used as a fallback when the environment variable
           is not set.
     """
     log_directory: Optional[str] = os.getenv(key=env_variable)
 
     if log_directory is None:
-        log_directory = "."
-    else:
-        if not os.path.exists(path=log_directory):
+        return Path(".")
+
+    log_directory_path = Path(log_directory)
+    # OSError, not just FileNotFoundError: a path through a regular file
+    # raises NotADirectoryError and unreadable parents raise PermissionError,
+    # all of which os.path.exists treated as "does not exist".
+    try:
+        log_directory_path.stat()
+    except OSError:
+        raise EnvironmentVariableNotFoundError(variable_name=env_variable)
+    return log_directory_path
+
+@lru_cache(maxsize=None)
+def _path_from_env(env_variable: str, check_if_exists: bool) -> Path:
+    """Perform the os.getenv lookup and existence check once per (variable, flag) pair."""
+    env_value = os.getenv(env_variable)
+
+    if env_value is None:
+        raise EnvironmentVariableNotFoundError(variable_name=env_variable)
+
+    path = Path(env_value)
+    if check_if_exists:
+        # A single attempted stat() replaces the separate os.path.exists
+        # check, which stats the path a second time just to answer yes/no.
+        # OSError covers everything exists() treated as "does not exist":
+        # missing paths, paths through regular files (NotADirectoryError)
+        # and unreadable parents (PermissionError).
+        try:
+            path.stat()
+        except OSError:
             raise EnvironmentVariableNotFoundError(variable_name=env_variable)
-    return Path(log_directory)
+
+    return path
 
 def get_path_from_env(env_variable: str, check_if_exists: bool = True) -> Path:
     """Retrieve a file path from an environment variable and validate it.
@@ -59,69 +93,84 @@ def get_path_from_env(env_variable: str, check_if_exists: bool = True) -> Path:
     Raises:
         ValueError: If the environment variable is not set or if the path does not exist
             when check_if_exists is True.
+
+    Note:
+        - The lookup (including the existence check) is cached per variable, since
+          environment variables do not change after process start. Call
+          `clear_env_cache` to re-read the environment, e.g. in tests.
     """
-    env_value = os.getenv(env_variable)
+    return _path_from_env(env_variable, check_if_exists)
 
-    if env_value is None: 
-        raise EnvironmentVariableNotFoundError(variable_name=env_variable)
-    
-    path = Path(env_value)
-    if check_if_exists and not os.path.exists(path=env_value):
-        raise EnvironmentVariableNotFoundError(variable_name=env_variable)
-    
-    return path
+@lru_cache(maxsize=None)
+def _integer_from_env(env_variable: str, default_value: int) -> int:
+    """Perform the os.getenv lookup and int conversion once per (variable, default) pair."""
+    env_value: Optional[str] = os.getenv(key=env_variable)
+
+    if env_value is None:
+        print(f"Environment variable {env_variable} has not been found. Defaulting to {default_value}")
+        return default_value
+
+    # isdecimal() screens out malformed values up front, so the common numeric
+    # case never pays for raising and unwinding a ValueError. isdigit() would
+    # be wrong here: superscripts like "²" pass it but int() rejects them.
+    stripped_value = env_value.strip()
+    digits = (
+        stripped_value[1:]
+        if stripped_value[:1] in ("-", "+")
+        else stripped_value
+    )
+    if digits.isdecimal():
+        try:
+            return int(stripped_value)
+        except ValueError:
+            pass
+
+    print(f"Error: {env_variable} environment variable '{env_variable}' is not a valid integer. Defaulting to {default_value}.")
+    return default_value
 
 def get_integer_from_env(env_variable: str, default_value: int) -> int:
     """
     Retrieve an integer from an environment variable, with a fallback to a default value.
 
-    This function attempts to fetch and convert an environment variable's value 
-    to an integer. If the conversion fails due to the variable not being set or 
-    containing non-integer data, it logs an error and returns the provided default 
+    This function attempts to fetch and convert an environment variable's value
+    to an integer. If the conversion fails due to the variable not being set or
+    containing non-integer data, it logs an error and returns the provided default
     value.
 
     Args:
         env_variable (str): The name of the environment variable to look up.
-        default_value (int, optional): The value to return if the environment 
-                                       variable's value cannot be converted 
+        default_value (int, optional): The value to return if the environment
+                                       variable's value cannot be converted
                                        to an integer.
 
     Returns:
-        int: The integer value from the environment variable if conversion is 
+        int: The integer value from the environment variable if conversion is
              successful, otherwise the default_value.
 
     Note:
-        - If the environment variable does not exist (i.e., `env_value` is `None`), 
-          or if it cannot be converted to an integer, an error is logged but 
+        - If the environment variable does not exist (i.e., `env_value` is `None`),
+          or if it cannot be converted to an integer, an error is logged but
           no exception is raised; the default value is returned instead.
+        - The lookup and conversion are cached per (variable, default) pair. Call
+          `clear_env_cache` to re-read the environment, e.g. in tests.
     """
-    env_value: Optional[str] = os.getenv(key=env_variable)
+    return _integer_from_env(env_variable, default_value)
 
-    if env_value is None:
-        print(f"Environment variable {env_variable} has not been found. Defaulting to {default_value}")
-        return default_value
-   
-    try:
-        return int(env_value)
-    except ValueError:
-        print(f"Error: {env_variable} environment variable '{env_variable}' is not a valid integer. Defaulting to {default_value}.")
-        return default_value
-    
 def get_float_from_env(env_variable: str, default_value: float) -> float:
     """
     Retrieve a float value from an environment variable, with a default fallback.
 
-    This function attempts to read and convert an environment variable to a float. If the 
-    variable is not set or cannot be converted to a float, it logs an error and returns 
+    This function attempts to read and convert an environment variable to a float. If the
+    variable is not set or cannot be converted to a float, it logs an error and returns
     the provided default value.
 
     Parameters:
     - env_variable (str): The name of the environment variable to look up.
-    - default_value (float): The default float value to return if the environment variable 
+    - default_value (float): The default float value to return if the environment variable
                              is not set or not a valid float.
 
     Returns:
-    - float: The float value from the environment variable, or the `default_value` if the 
+    - float: The float value from the environment variable, or the `default_value` if the
              variable is not set or invalid.
 
     Raises:
@@ -129,30 +178,44 @@ def get_float_from_env(env_variable: str, default_value: float) -> float:
 
     Notes:
     - This function uses `os.getenv` to check for the environment variable.
-    - Errors are logged using a hypothetical `log_error` function which should be defined 
+    - Errors are logged using a hypothetical `log_error` function which should be defined
       elsewhere in the codebase for logging purposes.
     - The function does not modify the environment; it only reads from it.
     """
-    
+
     env_value: Optional[str] = os.getenv(key=env_variable)
 
     if env_value is None:
         print(f"Error: {env_variable} environment variable has not been set in .env file. Defaulting to {default_value}.")
         return default_value
-   
+
     try:
         return float(env_value)
     except ValueError:
         print(f"Error: {env_variable} environment variable '{env_variable}' is not a valid float. Defaulting to {default_value}.")
         return default_value
-    
+
+@lru_cache(maxsize=None)
+def _string_from_env(env_variable: str, default_value: str, error_on_missing_value: bool) -> str:
+    """Perform the os.getenv lookup once per (variable, default, flag) triple."""
+    env_value: Optional[str] = os.getenv(key=env_variable)
+
+    if error_on_missing_value and env_value is None:
+        raise EnvironmentVariableNotFoundError(variable_name=env_variable)
+
+    try:
+        return str(object=env_value)
+    except ValueError:
+        print(f"Error: {env_variable} environment variable '{env_variable}' is not a valid float. Defaulting to {default_value}.")
+        return default_value
+
 def get_string_from_env(env_variable: str, default_value: str = "", error_on_missing_value: bool = False) -> str:
     """
     Retrieve a string value from an environment variable.
 
-    This function fetches the value of a specified environment variable and 
-    returns it as a string. If the environment variable is not set, it raises 
-    a `ValueError` with an informative message, logs the error, and prints it 
+    This function fetches the value of a specified environment variable and
+    returns it as a string. If the environment variable is not set, it raises
+    a `ValueError` with an informative message, logs the error, and prints it
     to stdout.
 
     Args:
@@ -161,28 +224,38 @@ def get_string_from_env(env_variable: str, default_value: str = "", error_on_mis
 
     Returns:
         str: The string value from the environment variable.
-        - default_value (str): The default str value to return if the environment variable 
+        - default_value (str): The default str value to return if the environment variable
                              is not set or not a valid str.
 
     Raises:
         ValueError: If the environment variable is not set.
 
     Note:
-        - This function assumes the existence of a `log_error` function for 
+        - This function assumes the existence of a `log_error` function for
           logging error messages. Ensure this function is defined or imported.
-        - The error message is both printed to stdout and logged for better 
+        - The error message is both printed to stdout and logged for better
           visibility and debugging.
+        - The lookup is cached per (variable, default) pair. Call `clear_env_cache`
+          to re-read the environment, e.g. in tests.
     """
+    return _string_from_env(env_variable, default_value, error_on_missing_value)
 
+@lru_cache(maxsize=None)
+def _boolean_from_env(env_variable: str, default_value: bool) -> bool:
+    """Perform the os.getenv lookup and bool conversion once per (variable, default) pair."""
     env_value: Optional[str] = os.getenv(key=env_variable)
 
-    if error_on_missing_value and env_value is None:
-        raise EnvironmentVariableNotFoundError(variable_name=env_variable)
+    if env_value is None:
+        print(f"Error: {env_variable} environment variable has not been set in .env file. Defaulting to {default_value}.")
+        return default_value
 
-    try:
-        return str(object=env_value)
-    except ValueError:
-        print(f"Error: {env_variable} environment variable '{env_variable}' is not a valid float. Defaulting to {default_value}.")
+    lower_env_value = env_value.lower()
+    if lower_env_value in _TRUE_VALUES:
+        return True
+    elif lower_env_value in _FALSE_VALUES:
+        return False
+    else:
+        print(f"Error: {env_variable} environment variable '{env_value}' is not a valid boolean. Defaulting to {default_value}.")
         return default_value
 
 def get_boolean_from_env(env_variable: str, default_value: bool) -> bool:
@@ -207,18 +280,24 @@ def get_boolean_from_env(env_variable: str, default_value: bool) -> bool:
     Note:
         - 'True' (case insensitive) will be interpreted as `True`, anything else as `False`.
         - This function uses `os.getenv` to fetch the environment variable, which returns `None` if the variable does not exist.
+        - The lookup and conversion are cached per (variable, default) pair. Call
+          `clear_env_cache` to re-read the environment, e.g. in tests.
     """
-    env_value: Optional[str] = os.getenv(key=env_variable)
+    return _boolean_from_env(env_variable, default_value)
 
-    if env_value is None:
-        print(f"Error: {env_variable} environment variable has not been set in .env file. Defaulting to {default_value}.")
-        return default_value
+def clear_env_cache() -> None:
+    """
+    Clear the memoized environment variable lookups.
 
-    lower_env_value = env_value.lower()
-    if lower_env_value in ('true', '1', 'yes', 'on'):
-        return True
-    elif lower_env_value in ('false', '0', 'no', 'off'):
-        return False
-    else:
-        print(f"Error: {env_variable} environment variable '{env_value}' is not a valid boolean. Defaulting to {default_value}.")
-        return default_value
\ No newline at end of file
+    Environment variables are assumed not to change after process start, so the
+    getters above cache their results, including the path existence checks. Code
+    that modifies `os.environ` at runtime (typically tests) should call this
+    function so that subsequent getter calls re-read the environment.
+
+    Returns:
+        None
+    """
+    _path_from_env.cache_clear()
+    _integer_from_env.cache_clear()
+    _string_from_env.cache_clear()
+    _boolean_from_env.cache_clear()
@@ -1,13 +1,24 @@
+import mmap
 import os
 import orjson
 from pathlib import Path
 
+# Files larger than this are mmap'd instead of read into an intermediate
+# bytes object before parsing.
+_MMAP_THRESHOLD_BYTES: int = 4096
+
+# Parsed status dicts keyed on path, with (st_mtime_ns, st_size) recording the
+# file version they were parsed from. Status files are typically polled, and a
+# single stat() per call is far cheaper than re-reading and re-parsing an
+# unchanged file.
+_JSON_CACHE: dict[str, tuple[int, int, dict]] = {}
+
 def load_analysis_status(status_json_path: str | Path, dictionary_status_entry_name: str) -> bool:
     """
     Load and check the status from a JSON file.
 
-    This function attempts to read a JSON file from the given path, looking for a specific 
-    status entry by name. If the entry exists and is truthy, it returns `True`. Otherwise, 
+    This function attempts to read a JSON file from the given path, looking for a specific
+    status entry by name. If the entry exists and is truthy, it returns `True`. Otherwise,
     it returns `False` or upon encountering any errors during file operations or JSON parsing.
 
     Parameters:
@@ -15,7 +26,7 @@ def load_analysis_status(status_json_path: str | Path, dictionary_status_entry_n
     - dictionary_status_entry_name (str): The key name within the JSON to check for the status.
 
     Returns:
-    - bool: 
+    - bool:
       - `True` if the status entry exists and is truthy.
       - `False` if:
         - The file does not exist.
@@ -30,14 +41,33 @@ def load_analysis_status(status_json_path: str | Path, dictionary_status_entry_n
     Notes:
     - The function uses `orjson` for JSON parsing for better performance.
     - Errors are logged but not raised, ensuring the function always returns a boolean.
+    - Files above 4 KiB are parsed straight from an mmap'd view to avoid the
+      intermediate bytes copy of the whole file.
+    - Parsed files are cached keyed on (mtime, size), so polling an unchanged
+      status file costs one stat() instead of a read and a JSON parse.
     """
     path = Path(status_json_path) if isinstance(status_json_path, str) else status_json_path
 
-    if not os.path.exists(path=path):
-        return False
     try:
+        file_stat = os.stat(path)
+        cache_key = str(path)
+        cached = _JSON_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return cached[2].get(dictionary_status_entry_name, False)
+
         with open(file=path, mode='rb') as file:
-            return orjson.loads(file.read()).get(dictionary_status_entry_name, False)
+            if file_stat.st_size > _MMAP_THRESHOLD_BYTES:
+                with mmap.mmap(file.fileno(), length=0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        status = orjson.loads(view)
+                    finally:
+                        view.release()
+            else:
+                status = orjson.loads(file.read())
+
+        _JSON_CACHE[cache_key] = (file_stat.st_mtime_ns, file_stat.st_size, status)
+        return status.get(dictionary_status_entry_name, False)
     except Exception:
         return False
     # except orjson.JSONDecodeError:
@@ -46,4 +76,4 @@ def load_analysis_status(status_json_path: str | Path, dictionary_status_entry_n
     #     log_error(message=f"IOError occurred when reading file {path}: {e}")
     # except Exception as e:
     #     log_error(message=f"Unexpected error when processing {path}: {e}")
-    # return False
\ No newline at end of file
+    # return False
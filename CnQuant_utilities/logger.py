@@ -1,17 +1,439 @@
 import atexit
+import copy
 import logging
+import threading
+import time
 from typing import Self
 import orjson
 from datetime import datetime
-from queue import Queue
+from queue import Empty, Full, Queue, SimpleQueue
 from pathlib import Path
 from logging.handlers import (
+    MemoryHandler,
     SMTPHandler,
     QueueHandler,
     QueueListener,
     RotatingFileHandler,
 )
 
+from ._logger_common import (
+    EMAIL_FORMATTER as _EMAIL_FORMATTER,
+    FastFormatter,
+    STD_FORMATTER as _STD_FORMATTER,
+    make_console_handler,
+    make_file_handler,
+    make_smtp_handler,
+)
+
+
+# Single mapping from level names to logging constants, shared by Logger and
+# AsyncLogger so validation is one dict lookup and the table exists once. It
+# is derived from the stdlib's own name table (plus the historical "none"
+# alias for NOTSET), so aliases like "warn" and "fatal" work too.
+_LEVEL_MAP: dict[str, int] = {
+    name.lower(): value for name, value in logging._nameToLevel.items()
+}
+_LEVEL_MAP["none"] = logging.NOTSET
+
+# Bare formatter used only for rendering exception text on the producer side
+# of FastQueueHandler.prepare; the record's real formatter applies later on
+# the listener thread.
+_EXC_FORMATTER = logging.Formatter()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A `FileHandler` that buffers writes instead of flushing every record.
+
+    The stock `FileHandler` flushes after each emitted record, issuing one
+    write() syscall per log line. This subclass opens the file with a 64 KiB
+    buffer and only flushes immediately for ERROR and above, so routine
+    records are written out in page-sized batches. A daemon timer flushes the
+    buffer every 30 seconds and an atexit hook flushes on shutdown, so at most
+    the last 30 seconds of sub-ERROR records are ever pending.
+    """
+
+    FLUSH_INTERVAL_SECONDS: int = 30
+    BUFFER_SIZE: int = 64 * 1024
+    # Flush regardless of level once this much unflushed data has been
+    # written, so a quiet-but-steady stream cannot sit in the buffer and the
+    # OS page cache indefinitely.
+    SOFT_MAX_BYTES: int = 128 * 1024
+
+    def __init__(self, filename, mode="a", encoding=None, delay=False, errors=None):
+        super().__init__(
+            filename, mode=mode, encoding=encoding, delay=delay, errors=errors
+        )
+        self._unflushed_bytes: int = 0
+        self._scratch = bytearray(8192)
+        self._flush_timer: threading.Timer | None = None
+        self._schedule_flush()
+        atexit.register(self.flush)
+
+    def _open(self):
+        """Open the log file in binary mode with a large buffer."""
+        mode = self.mode if "b" in self.mode else self.mode + "b"
+        return open(self.baseFilename, mode, buffering=self.BUFFER_SIZE)
+
+    def _schedule_flush(self) -> None:
+        """(Re-)arm the daemon timer that periodically flushes the buffer."""
+        self._flush_timer = threading.Timer(
+            interval=self.FLUSH_INTERVAL_SECONDS, function=self._periodic_flush
+        )
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _periodic_flush(self) -> None:
+        self.flush()
+        self._schedule_flush()
+
+    def flush(self) -> None:
+        super().flush()
+        self._unflushed_bytes = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record to the buffered stream, flushing only on ERROR+ or soft max."""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record=record) + self.terminator
+            data = msg.encode(self.encoding or "utf-8", errors="replace")
+            self.stream.write(data)
+            self._unflushed_bytes += len(data)
+            if (
+                record.levelno >= logging.ERROR
+                or self._unflushed_bytes > self.SOFT_MAX_BYTES
+            ):
+                self.flush()
+        except Exception:
+            self.handleError(record=record)
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Emit a batch of records under one lock with a single stream write.
+
+        Used by `BatchedQueueListener`: the handler lock is taken once for the
+        whole batch, all records are encoded into the reusable scratch buffer,
+        and a single write() lands them in the buffered stream, with one flush
+        at the end if any record was ERROR or above or the soft max was
+        exceeded. A record that fails to format goes through `handleError`
+        without taking the rest of the batch down with it.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        self.acquire()
+        try:
+            scratch = self._scratch
+            del scratch[:]
+            encoding = self.encoding or "utf-8"
+            terminator = self.terminator
+            for record in records:
+                try:
+                    scratch += (self.format(record=record) + terminator).encode(
+                        encoding, "replace"
+                    )
+                except Exception:
+                    self.handleError(record=record)
+            self.stream.write(memoryview(scratch))
+            self._unflushed_bytes += len(scratch)
+            if (
+                any(record.levelno >= logging.ERROR for record in records)
+                or self._unflushed_bytes > self.SOFT_MAX_BYTES
+            ):
+                self.flush()
+            if len(scratch) > self.SOFT_MAX_BYTES:
+                del scratch[self.SOFT_MAX_BYTES:]
+        except Exception:
+            self.handleError(record=records[-1])
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        super().close()
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """
+    A `RotatingFileHandler` that can emit a drained batch in one write.
+
+    `BatchedQueueListener` hands whole batches to handlers exposing
+    `handle_batch`; the stock rotating handler only offers per-record
+    `handle`, so every record pays its own lock, write and flush. While the
+    current file position plus the formatted batch stays clear of `maxBytes`,
+    this handler formats the entire batch and lands it with a single write
+    and a single flush under one lock. Near the rotation threshold it falls
+    back to per-record emits so rollover still happens at record granularity.
+    """
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Emit a batch of records under one lock, rotating when needed."""
+        self.acquire()
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            terminator = self.terminator
+            chunk = "".join(
+                self.format(record=record) + terminator for record in records
+            )
+            if self.maxBytes > 0 and self.stream.tell() + len(chunk) >= self.maxBytes:
+                for record in records:
+                    if self.shouldRollover(record=record):
+                        self.doRollover()
+                    logging.FileHandler.emit(self, record)
+            else:
+                self.stream.write(chunk)
+                self.flush()
+        except Exception:
+            self.handleError(record=records[-1])
+        finally:
+            self.release()
+
+
+class BatchedQueueListener(QueueListener):
+    """
+    A `QueueListener` that drains the queue in batches instead of per record.
+
+    The stock listener pops and handles one LogRecord per loop iteration, so a
+    burst of records pays one wakeup, one lock acquisition and (for stream
+    handlers) one write per record. This subclass blocks for the first record,
+    then greedily drains whatever else is already queued (up to `MAX_BATCH`)
+    and hands the whole batch to each handler in one go. Handlers that expose
+    a `handle_batch(records)` method (e.g. `BufferedFileHandler`) receive the
+    batch directly and can emit it under a single lock with a single write;
+    all other handlers fall back to per-record handling.
+    """
+
+    MAX_BATCH: int = 256
+
+    def __init__(self, queue, *handlers, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        # The handler set is fixed for the listener's lifetime, so resolve
+        # each handler's batch capability once instead of a getattr per batch.
+        self._dispatch = tuple(
+            (handler, getattr(handler, "handle_batch", None))
+            for handler in handlers
+        )
+
+    def enqueue_sentinel(self) -> None:
+        """Enqueue the stop sentinel, evicting the oldest record if the queue is full.
+
+        The stock implementation's bare put_nowait raises queue.Full when a
+        bounded queue is at capacity, turning a log storm at shutdown into an
+        unhandled exception from the atexit hook and a listener thread that is
+        never joined. Dropping the oldest record mirrors
+        `DropOldestQueueHandler`'s overflow policy.
+        """
+        queue = self.queue
+        while True:
+            try:
+                queue.put_nowait(self._sentinel)
+                return
+            except Full:
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    pass
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """Dispatch a drained batch to every handler, once per handler."""
+        respect_handler_level = self.respect_handler_level
+        for handler, batch_handle in self._dispatch:
+            if respect_handler_level:
+                matching = [r for r in records if r.levelno >= handler.level]
+            else:
+                matching = records
+            if not matching:
+                continue
+            if batch_handle is not None:
+                batch_handle(matching)
+            else:
+                handle = handler.handle
+                for record in matching:
+                    handle(record)
+
+    def _monitor(self) -> None:
+        """Drain the queue in batches until the stop sentinel is seen.
+
+        Every attribute used per iteration (queue methods, sentinel, batch
+        limit, dispatcher) is bound to a local up front, so the loop body pays
+        no repeated LOAD_ATTR cost per record.
+        """
+        q = self.queue
+        get = q.get
+        get_nowait = q.get_nowait
+        task_done = q.task_done if hasattr(q, "task_done") else None
+        sentinel = self._sentinel
+        max_batch = self.MAX_BATCH
+        handle_batch = self.handle_batch
+        stopping = False
+        while not stopping:
+            batch = [get()]
+            append = batch.append
+            try:
+                while len(batch) < max_batch:
+                    append(get_nowait())
+            except Empty:
+                pass
+            if task_done is not None:
+                for _ in batch:
+                    task_done()
+            if sentinel in batch:
+                stopping = True
+                batch = batch[: batch.index(sentinel)]
+            if batch:
+                handle_batch(batch)
+
+
+def _install_fast_call_handlers(logger: logging.Logger) -> None:
+    """
+    Replace `logger.callHandlers` with a flat loop over a handler snapshot.
+
+    The stock `callHandlers` walks the logger's parent chain on every record,
+    re-reading each ancestor's handler list and falling back to
+    `logging.lastResort` when nothing matched. The loggers built by this
+    package own a closed set of handlers fixed at construction, so the parent
+    walk and the fallback are pure overhead. This installs an instance-level
+    `callHandlers` that iterates a tuple snapshot of the current handlers with
+    one level compare per handler, and disables propagation so ancestor
+    handlers are never consulted. Handlers added to the logger after this call
+    will not be seen; reinstall to pick them up.
+
+    Args:
+        logger (logging.Logger): The logger whose handlers to snapshot.
+
+    Returns:
+        None
+    """
+    logger.propagate = False
+    handler_tuple = tuple(logger.handlers)
+
+    def callHandlers(record: logging.LogRecord) -> None:
+        for handler in handler_tuple:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    logger.callHandlers = callHandlers
+
+
+class FastQueueHandler(QueueHandler):
+    """
+    A `QueueHandler` that enqueues records with minimal producer-side work.
+
+    The stock `prepare` formats the record on the producer thread and copies
+    it into a picklable shell, because the queue might cross a process
+    boundary. The listeners in this module run in the same process, so none
+    of that is needed: `prepare` only merges the message arguments (so large
+    producer-owned argument objects are released immediately instead of being
+    retained until the listener drains the queue, and cannot be mutated
+    before formatting) and pre-renders any exception text. The full `format`
+    call still happens on the listener thread, leaving the producer with
+    little more than a `%` merge and a queue put.
+
+    Note:
+        - Merging the arguments in `prepare` breaks lazy %-formatting for any
+          further subscribers that expect `record.args` to survive the queue;
+          such setups should use the synchronous `Logger` instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge `record.args` into the message; full formatting stays on the listener side."""
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            # Render the traceback now so frame objects are not held alive in
+            # the queue; Formatter.format picks up the cached exc_text.
+            if not record.exc_text:
+                record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+
+class CopyingFastQueueHandler(FastQueueHandler):
+    """
+    A `FastQueueHandler` that enqueues a shallow copy of the record.
+
+    Required whenever the same `LogRecord` object reaches more than one
+    handler: `Formatter.format` mutates the record (`message`, `asctime`), so
+    a record shared between two listener queues — or between a queue and a
+    synchronous handler on the producer thread — would be mutated
+    concurrently. The copy is taken on the producer thread before the
+    argument merge, so each consumer owns its record outright; the original
+    is left untouched for the other handlers.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Shallow-copy `record`, then apply the fast prepare to the copy."""
+        return super().prepare(copy.copy(record))
+
+
+class DropOldestQueueHandler(FastQueueHandler):
+    """
+    A `QueueHandler` for bounded queues that drops the oldest record when full.
+
+    With an unbounded queue, a log storm that outpaces the listener grows the
+    queue (and process memory) without limit. This handler is meant for a
+    `queue.Queue` with a `maxsize`: when the queue is full it discards the
+    oldest queued record to make room for the newest one, counts the drop, and
+    at most once per second enqueues a synthetic WARNING record summarizing
+    how many records were lost. Producers therefore never block and memory
+    stays bounded, at the cost of losing the stalest records under overload.
+    """
+
+    REPORT_INTERVAL_SECONDS: float = 1.0
+
+    def __init__(self, queue: Queue):
+        super().__init__(queue=queue)
+        self._dropped: int = 0
+        self._reported: int = 0
+        self._last_report: float = time.monotonic()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue `record` without blocking, evicting the oldest entry if full."""
+        queue = self.queue
+        try:
+            queue.put_nowait(record)
+            return
+        except Full:
+            pass
+        try:
+            queue.get_nowait()
+        except Empty:
+            pass
+        self._dropped += 1
+        try:
+            queue.put_nowait(record)
+        except Full:
+            # Another producer refilled the slot first; drop the new record too.
+            self._dropped += 1
+            return
+        now = time.monotonic()
+        if now - self._last_report >= self.REPORT_INTERVAL_SECONDS:
+            unreported = self._dropped - self._reported
+            self._reported = self._dropped
+            self._last_report = now
+            report = logging.LogRecord(
+                name=record.name,
+                level=logging.WARNING,
+                pathname=__file__,
+                lineno=0,
+                msg="Log queue full: dropped %d records since last report",
+                args=(unreported,),
+                exc_info=None,
+            )
+            try:
+                queue.put_nowait(report)
+            except Full:
+                pass
+
 
 class JsonFormatter(logging.Formatter):
     def format(self, record):
@@ -27,15 +449,13 @@ class JsonFormatter(logging.Formatter):
         return orjson.dumps(log_entry).decode("utf-8")
 
 
+# Shared JSON formatter instance for AsyncLogger file handlers; the plain-text
+# formatter singletons live in _logger_common alongside the handler factories.
+_JSON_FORMATTER = JsonFormatter()
+
+
 class AsyncLogger:
-    LOG_LEVEL_MAP = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-        "none": logging.NOTSET,
-    }
+    LOG_LEVEL_MAP = _LEVEL_MAP
 
     def __init__(
         self,
@@ -51,6 +471,7 @@ class AsyncLogger:
         smtp_port: int = 587,
         log_level_for_emails: str = "critical",
         max_log_file_size_MB: int = 10,
+        queue_capacity: int | None = None,
     ):
         """
         Initialize the logger with console, file, and optional email handlers.
@@ -67,6 +488,11 @@ class AsyncLogger:
             smtp_port (int, optional): SMTP server port. Defaults to 587.
             log_level_for_emails (str, optional): Log level for triggering email notifications. Defaults to "critical".
             max_log_file_size_MB (int, optional): Maximum log file size in megabytes before rotation. Defaults to 10.
+            queue_capacity (int | None, optional): Maximum number of records the
+                log queue may hold. When full, the oldest record is dropped and
+                the drops are reported via a periodic synthetic WARNING.
+                Defaults to None, which uses an unbounded lock-free
+                `queue.SimpleQueue` for the cheapest possible producer put.
         Raises:
             ValueError: If log_level or file_log_level is not a valid log level.
         Notes:
@@ -82,22 +508,27 @@ class AsyncLogger:
             file_log_level.lower() if file_log_level is not None else "none"
         )
         self.max_log_file_size_MB: float = max_log_file_size_MB
-        self.queue = Queue()
+        # Unbounded by default: SimpleQueue's C implementation makes the
+        # producer-side put considerably cheaper than Queue's lock plus
+        # condition variable. Passing a capacity switches to a bounded
+        # queue.Queue with the drop-oldest policy; see DropOldestQueueHandler.
+        self.queue = (
+            Queue(maxsize=queue_capacity) if queue_capacity else SimpleQueue()
+        )
         self.listeners = []
         handlers = []
-        if self.log_level not in self.LOG_LEVEL_MAP:
+        console_log_level = self.LOG_LEVEL_MAP.get(self.log_level)
+        if console_log_level is None:
             raise ValueError(
                 f"log_level must be one of: {', '.join(self.LOG_LEVEL_MAP.keys())}. Got: {self.log_level}"
             )
 
-        if self.file_log_level not in self.LOG_LEVEL_MAP:
+        _file_log_level = self.LOG_LEVEL_MAP.get(self.file_log_level)
+        if _file_log_level is None:
             raise ValueError(
                 f"file_log_level must be one of: {', '.join(self.LOG_LEVEL_MAP.keys())}. Got: {self.file_log_level}"
             )
 
-        console_log_level = self.LOG_LEVEL_MAP[self.log_level]
-        _file_log_level = self.LOG_LEVEL_MAP[self.file_log_level]
-
         # Select log level
         min_level = min(
             console_log_level, _file_log_level if log_file else logging.CRITICAL
@@ -105,27 +536,20 @@ class AsyncLogger:
         self.logger.setLevel(level=min_level)
 
         # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(level=console_log_level)
-        console_format = logging.Formatter(
-            fmt="%(asctime)s - app_name: %(name)s - %(levelname)s - %(message)s"
-        )
-        console_handler.setFormatter(fmt=console_format)
+        console_handler = make_console_handler(level=console_log_level)
         handlers.append(console_handler)
 
         # File handler
         if log_file is not None:
-            log_file_path = Path(log_file)
-            log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = RotatingFileHandler(
-                filename=log_file_path,
+            file_handler = make_file_handler(
+                log_file,
+                _file_log_level,
+                formatter=_JSON_FORMATTER,
+                handler_factory=BatchedRotatingFileHandler,
                 mode="a",
                 maxBytes=self.max_log_file_size_MB * 1024 * 1024,
                 backupCount=5,
             )
-            file_handler.setLevel(level=_file_log_level)
-            file_format = JsonFormatter()
-            file_handler.setFormatter(fmt=file_format)
             file_handler.terminator = "\n"
             handlers.append(file_handler)
 
@@ -135,30 +559,59 @@ class AsyncLogger:
             and self.log_level == self.log_level_for_emails
         ):
             try:
-                email_handler = SMTPHandler(
-                    mailhost=(smtp_host, smtp_port),
-                    fromaddr=smtp_user,
-                    toaddrs=email_to.split(","),
-                    subject=email_subject,
-                    credentials=(smtp_user, smtp_password),
-                    secure=(),
+                email_handler = make_smtp_handler(
+                    smtp_host=smtp_host,
+                    smtp_port=smtp_port,
+                    smtp_user=smtp_user,
+                    smtp_password=smtp_password,
+                    email_to=email_to.split(","),
+                    email_subject=email_subject,
+                    formatter=_STD_FORMATTER,
+                    handler_factory=SMTPHandler,
+                )
+                # Batch criticals so a burst produces one SMTP session for up
+                # to 50 records instead of a blocking TCP+TLS handshake per
+                # record. The flushLevel above CRITICAL means only capacity,
+                # an explicit flush or shutdown triggers the send, and the
+                # MemoryHandler runs inside the listener thread, so producers
+                # never touch SMTP.
+                buffered_email_handler = MemoryHandler(
+                    capacity=50,
+                    flushLevel=logging.CRITICAL + 1,
+                    target=email_handler,
+                    flushOnClose=True,
                 )
-                email_handler.setLevel(level=logging.CRITICAL)
-                email_format = logging.Formatter(
-                    fmt="%(asctime)s - app_name: %(name)s - %(levelname)s - %(message)s"
+                buffered_email_handler.setLevel(level=logging.CRITICAL)
+                atexit.register(buffered_email_handler.flush)
+                # The email handler gets its own queue; sharing self.queue with
+                # the main listener would make the two listeners compete for
+                # records. Only CRITICAL records are enqueued at all.
+                # CRITICAL records also land on the main queue, so the email
+                # path must enqueue its own copy: the two listener threads
+                # would otherwise format (and mutate) the same record object.
+                self.email_queue = SimpleQueue()
+                queue_email_handler = CopyingFastQueueHandler(queue=self.email_queue)
+                queue_email_handler.setLevel(level=logging.CRITICAL)
+                self.listeners.append(
+                    BatchedQueueListener(self.email_queue, buffered_email_handler)
                 )
-                email_handler.setFormatter(fmt=email_format)
-                queue_email_handler = QueueHandler(queue=self.queue)
-                self.listeners.append(QueueListener(self.queue, email_handler))
                 self.logger.addHandler(hdlr=queue_email_handler)
             except Exception as e:
                 self.logger.warning(f"Failed to set up email handler: {e}")
 
         # Use one listener for all handlers
         if handlers:
-            queue_handler = QueueHandler(self.queue)
+            # Drop-oldest only applies to the bounded variant; SimpleQueue
+            # never reports Full, so the stock enqueue suffices there.
+            if queue_capacity:
+                queue_handler = DropOldestQueueHandler(queue=self.queue)
+            else:
+                queue_handler = FastQueueHandler(queue=self.queue)
+            self.queue_handler = queue_handler
             self.logger.addHandler(queue_handler)
-            self.listeners.append(QueueListener(self.queue, *handlers))
+            self.listeners.append(
+                BatchedQueueListener(self.queue, *handlers, respect_handler_level=True)
+            )
 
         # Set logger level
         if handlers:
@@ -166,18 +619,54 @@ class AsyncLogger:
             min_level = min(handler_levels) if handler_levels else logging.DEBUG
             self.logger.setLevel(min_level)
 
+        # No handler may sit below the logger's effective level; records below
+        # it are dropped by the logger anyway, so raising the handler levels
+        # keeps the per-handler compare in the listener from ever passing a
+        # record the logger itself would have filtered.
+        for handler in self.logger.handlers:
+            handler.setLevel(level=max(handler.level, self.logger.level))
+
+        _install_fast_call_handlers(logger=self.logger)
+
         self.start_async_logging()
         atexit.register(self.stop_async_logging)
 
+    @classmethod
+    def disable_below(cls, level: str) -> None:
+        """
+        Globally disable all logging calls below `level`.
+
+        This installs a process-wide `logging.disable` threshold one below the
+        given level, so a disabled call (e.g. `logger.debug` while "info" is
+        the floor) returns after a single integer comparison in
+        `isEnabledFor`, without building a LogRecord or touching handlers.
+        Pass "none" to lift the threshold again.
+
+        Args:
+            level (str): Minimum level name that should remain enabled, e.g.
+                "info". Accepts the same names as the constructor.
+
+        Raises:
+            ValueError: If `level` is not a valid log level name.
+        """
+        numeric_level = cls.LOG_LEVEL_MAP.get(level.lower())
+        if numeric_level is None:
+            raise ValueError(
+                f"level must be one of: {', '.join(cls.LOG_LEVEL_MAP.keys())}. Got: {level}"
+            )
+        logging.disable(level=numeric_level - 1)
+
     def start_async_logging(self):
-        """Start the asynchronous listeners."""
+        """Start the asynchronous listeners. Already-running listeners are left alone."""
         for listener in self.listeners:
-            listener.start()
+            if listener._thread is None:
+                listener.start()
 
     def stop_async_logging(self):
-        """Stop the asynchronous listeners."""
+        """Stop the asynchronous listeners. Already-stopped listeners are left alone."""
         for listener in self.listeners:
-            listener.stop()
+            if listener._thread is not None:
+                listener.stop()
 
     def get_logger(self) -> logging.Logger:
         """Return the configured logger."""
@@ -185,14 +674,7 @@ class AsyncLogger:
 
 
 class Logger:
-    LOG_LEVEL_MAP = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-        "none": logging.NOTSET,
-    }
+    LOG_LEVEL_MAP = _LEVEL_MAP
 
     def __init__(
         self,
@@ -207,6 +689,7 @@ class Logger:
         email_subject: str = "",
         smtp_port: int = 587,
         log_level_for_emails: str = "critical",
+        async_console: bool = False,
     ):
         """
         Initialize a logger with console, file, and email handlers.
@@ -221,6 +704,9 @@ class Logger:
             smtp_password: SMTP password.
             email_to: Comma-separated list as a string of recipient email addresses for critical logs.
             email_subject: Subject for critical log emails.
+            async_console: If True, route console output through a SimpleQueue
+                and a background listener, so threads emitting records never
+                serialize on the console handler's lock or block on stderr I/O.
         """
         self.logger = logging.getLogger(name=name)
         self.log_level = log_level.lower()
@@ -228,78 +714,126 @@ class Logger:
         self.file_log_level: str = (
             file_log_level.lower() if file_log_level is not None else "none"
         )
-        self.log_levels: list[str] = [
-            "none",
-            "debug",
-            "info",
-            "warning",
-            "error",
-            "critical",
-        ]
-
-        if self.log_level not in self.LOG_LEVEL_MAP:
+        self._console_listener: BatchedQueueListener | None = None
+
+        # logging.getLogger(name) returns the same singleton for every
+        # Logger(name=...) construction; once handlers are attached, the new
+        # config would be discarded anyway, so skip the validation, level
+        # mapping, mkdir and SMTP setup entirely.
+        if self.logger.handlers:
+            return
+
+        console_log_level = self.LOG_LEVEL_MAP.get(self.log_level)
+        if console_log_level is None:
             raise ValueError(
                 f"log_level must be one of: {', '.join(self.LOG_LEVEL_MAP.keys())}. Got: {self.log_level}"
             )
 
-        if self.file_log_level not in self.LOG_LEVEL_MAP:
+        _file_log_level = self.LOG_LEVEL_MAP.get(self.file_log_level)
+        if _file_log_level is None:
             raise ValueError(
                 f"file_log_level must be one of: {', '.join(self.LOG_LEVEL_MAP.keys())}. Got: {self.file_log_level}"
             )
 
-        console_log_level = self.LOG_LEVEL_MAP[self.log_level]
-        _file_log_level = self.LOG_LEVEL_MAP[self.file_log_level]
-
         # Select log level
         min_level = min(
             console_log_level, _file_log_level if log_file else logging.CRITICAL
         )
         self.logger.setLevel(level=min_level)
 
-        # Avoid duplicate handlers if logger is reused
-        if not self.logger.handlers:
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(level=console_log_level)
-            console_format = logging.Formatter(
-                fmt="%(asctime)s - app_name: %(name)s - %(levelname)s - %(message)s"
+        # Console handler
+        console_handler = make_console_handler(level=console_log_level)
+        if async_console:
+            # Producers only put onto a lock-free SimpleQueue; the listener
+            # thread owns the console handler and its lock. The copying
+            # variant is used because the file and email handlers below
+            # format the same record synchronously on the producer thread.
+            console_queue = SimpleQueue()
+            self.logger.addHandler(hdlr=CopyingFastQueueHandler(queue=console_queue))
+            self._console_listener = BatchedQueueListener(
+                console_queue, console_handler, respect_handler_level=True
             )
-            console_handler.setFormatter(fmt=console_format)
+            self._console_listener.start()
+            atexit.register(self.stop_async_console)
+        else:
             self.logger.addHandler(hdlr=console_handler)
 
-            # File handler
-            if log_file is not None:
-                log_file_path = Path(log_file)
-                log_file_path.parent.mkdir(parents=True, exist_ok=True)
-                file_handler = logging.FileHandler(filename=log_file_path)
-                # Select level on which the messages will be saved to a file
-                file_handler.setLevel(level=_file_log_level)
+        # File handler
+        if log_file is not None:
+            # Select level on which the messages will be saved to a file
+            file_handler = make_file_handler(
+                log_file, _file_log_level, handler_factory=BufferedFileHandler
+            )
+            self.logger.addHandler(hdlr=file_handler)
 
-                file_format = logging.Formatter(
-                    fmt="%(asctime)s - app_name: %(name)s - %(levelname)s - %(message)s"
-                )
-                file_handler.setFormatter(fmt=file_format)
-                self.logger.addHandler(hdlr=file_handler)
+        # Email handler for CRITICAL
+        if (
+            all([smtp_user, smtp_host, smtp_password, email_to])
+            and self.log_level == self.log_level_for_emails
+        ):
+            email_handler = make_smtp_handler(
+                smtp_host=smtp_host,
+                smtp_port=smtp_port,
+                smtp_user=smtp_user,
+                smtp_password=smtp_password,
+                email_to=email_to,
+                email_subject=email_subject,
+                formatter=_EMAIL_FORMATTER,
+                handler_factory=SMTPHandler,
+            )
+            # Buffer criticals so a burst produces one SMTP session for up to
+            # 10 records instead of a full TCP+TLS handshake per record. The
+            # flushLevel above CRITICAL means only capacity (or shutdown)
+            # triggers the flush.
+            buffered_email_handler = MemoryHandler(
+                capacity=10,
+                flushLevel=logging.CRITICAL + 1,
+                target=email_handler,
+            )
+            buffered_email_handler.setLevel(level=logging.CRITICAL)
+            self.logger.addHandler(hdlr=buffered_email_handler)
+            atexit.register(buffered_email_handler.flush)
 
-            # Email handler for CRITICAL
-            if (
-                all([smtp_user, smtp_host, smtp_password, email_to])
-                and self.log_level == self.log_level_for_emails
-            ):
-                email_handler = SMTPHandler(
-                    mailhost=(smtp_host, smtp_port),
-                    fromaddr=smtp_user,
-                    toaddrs=email_to,
-                    subject=email_subject,
-                    credentials=(smtp_user, smtp_password),
-                    secure=(),
-                )
-                email_handler.setLevel(level=logging.CRITICAL)
-                email_format = logging.Formatter(
-                    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(pathname)s:%(lineno)d"
-                )
-                email_handler.setFormatter(fmt=email_format)
-                self.logger.addHandler(hdlr=email_handler)
+        # No handler may sit below the logger's effective level; records below
+        # it never reach the handlers, so raising the handler levels keeps
+        # callHandlers' per-handler compare from ever passing a record the
+        # logger itself would have filtered.
+        for handler in self.logger.handlers:
+            handler.setLevel(level=max(handler.level, self.logger.level))
+
+        _install_fast_call_handlers(logger=self.logger)
+
+    @classmethod
+    def disable_below(cls, level: str) -> None:
+        """
+        Globally disable all logging calls below `level`.
+
+        See `AsyncLogger.disable_below`; the threshold is process-wide, so the
+        two classes share its effect. Pass "none" to lift the threshold again.
+
+        Args:
+            level (str): Minimum level name that should remain enabled, e.g.
+                "info". Accepts the same names as the constructor.
+
+        Raises:
+            ValueError: If `level` is not a valid log level name.
+        """
+        numeric_level = cls.LOG_LEVEL_MAP.get(level.lower())
+        if numeric_level is None:
+            raise ValueError(
+                f"level must be one of: {', '.join(cls.LOG_LEVEL_MAP.keys())}. Got: {level}"
+            )
+        logging.disable(level=numeric_level - 1)
+
+    def stop_async_console(self):
+        """Stop the console listener thread, draining queued records first.
+
+        Only meaningful when the logger was constructed with
+        `async_console=True`; otherwise this is a no-op. Safe to call more
+        than once (it is also registered with atexit).
+        """
+        if self._console_listener is not None and self._console_listener._thread is not None:
+            self._console_listener.stop()
 
     def get_logger(self) -> logging.Logger:
         """Return the configured logger."""
@@ -2,6 +2,42 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+from ._logger_common import FastFormatter, make_console_handler, make_file_handler
+
+# Shared formatter: both handlers use the same format string, so parse it once
+# at import instead of once per setup_logger call.
+_STD_FORMATTER = FastFormatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+class FastRotatingFileHandler(RotatingFileHandler):
+    """
+    A `RotatingFileHandler` that skips filesystem checks while far from rollover.
+
+    The stock `shouldRollover` calls `os.path.exists` and `os.path.isfile` on
+    every emitted record, which adds two stat() syscalls per log line. As long
+    as the current stream position plus the formatted message still fits below
+    `maxBytes`, no rollover can be needed, so this subclass answers from the
+    cached stream position alone and only falls back to the stock check when
+    the size threshold is actually approached.
+    """
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        """
+        Determine if rollover should occur, avoiding stat() in the common case.
+
+        Args:
+            record (logging.LogRecord): The record about to be emitted.
+
+        Returns:
+            int: 1 if rollover should occur, 0 otherwise.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            msg_length = len(self.format(record=record)) + 1
+            if self.stream.tell() + msg_length < self.maxBytes:
+                return 0
+        return super().shouldRollover(record)
+
 def setup_logger(log_directory: Path, log_file_name: str):
     """
     Configure and return a logger with file rotation and console output.
@@ -19,8 +55,8 @@ def setup_logger(log_directory: Path, log_file_name: str):
         logging.Logger: A configured logger instance.
 
     The logger configuration includes:
-    - **File Handler**: 
-        - Uses `RotatingFileHandler` for log file management.
+    - **File Handler**:
+        - Uses `FastRotatingFileHandler` for log file management.
         - Logs at INFO level or above.
         - Log files rotate when they reach 1 MB (1,000,000 bytes), with up to 3 backups.
     - **Console Handler**: 
@@ -37,17 +73,14 @@ def setup_logger(log_directory: Path, log_file_name: str):
     logger = logging.getLogger(name=__name__)
     logger.setLevel(level=logging.INFO)
 
-    file_handler = RotatingFileHandler(filename=log_directory/log_file_name, 
-                                       maxBytes=1000000, 
-                                       backupCount=3)
-    file_handler.setLevel(logging.INFO)
-
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.ERROR)
+    file_handler = make_file_handler(log_directory/log_file_name,
+                                     logging.INFO,
+                                     formatter=_STD_FORMATTER,
+                                     handler_factory=FastRotatingFileHandler,
+                                     maxBytes=1000000,
+                                     backupCount=3)
 
-    formatter = logging.Formatter(fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(fmt=formatter)
-    console_handler.setFormatter(fmt=formatter)
+    console_handler = make_console_handler(level=logging.ERROR, formatter=_STD_FORMATTER)
 
     logger.addHandler(hdlr=file_handler)
     logger.addHandler(hdlr=console_handler)
@@ -72,8 +105,11 @@ def log_error(logger: logging.Logger, message: str) -> None:
     Note:
         - This method does not handle exceptions; it merely logs them.
         - The actual logging behavior depends on the configuration of the logging module.
+        - When ERROR is disabled on the logger, the call returns after a single
+          level check without building a LogRecord or touching the handlers.
     """
-    logger.error(msg=message)
+    if logger.isEnabledFor(level=logging.ERROR):
+        logger.error(msg=message)
 
 def log_warning(logger: logging.Logger, message: str) -> None:
     """
@@ -93,5 +129,8 @@ def log_warning(logger: logging.Logger, message: str) -> None:
     Note:
         - This method does not handle exceptions; it merely logs them.
         - The actual logging behavior depends on the configuration of the logging module.
+        - When WARNING is disabled on the logger, the call returns after a single
+          level check without building a LogRecord or touching the handlers.
     """
-    logger.warning(msg=message)
\ No newline at end of file
+    if logger.isEnabledFor(level=logging.WARNING):
+        logger.warning(msg=message)
\ No newline at end of file
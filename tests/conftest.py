@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+# Make the repository root importable exactly once per session, instead of
+# each test module prepending its own (relative, duplicate) entries to
+# sys.path at import time. Redundant with an editable install, but keeps
+# `pytest tests` working from a bare checkout.
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
@@ -1,25 +1,51 @@
-import sys
-
-sys.path.insert(0, "../..")
-sys.path.insert(0, "../CnQuant_utilities")
 import unittest
+import io
 import logging
+import queue
 import tempfile
-import os
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from CnQuant_utilities.logger import Logger, AsyncLogger
+from CnQuant_utilities.logger import (
+    Logger,
+    AsyncLogger,
+    BatchedRotatingFileHandler,
+    BufferedFileHandler,
+    CopyingFastQueueHandler,
+    FastFormatter,
+)
+
+
+def make_record(msg, level=logging.INFO):
+    return logging.LogRecord(
+        name="test",
+        level=level,
+        pathname="",
+        lineno=0,
+        msg=msg,
+        args=(),
+        exc_info=None,
+    )
 
 
 class TestLogger(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
     def setUp(self):
         self.logger_name = f"test_logger_{self._testMethodName}"
-        self.temp_log_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_log_file.close()
+        # Only a path; the file is first created when a handler opens it.
+        self.temp_log_file_name = str(
+            Path(self.tmpdir.name) / f"{self._testMethodName}.log"
+        )
 
     def tearDown(self):
-        if os.path.exists(self.temp_log_file.name):
-            os.unlink(self.temp_log_file.name)
+        Path(self.temp_log_file_name).unlink(missing_ok=True)
 
     def test_init_valid_levels(self):
         logger_instance = Logger(
@@ -28,13 +54,11 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(logger_instance.logger.name, self.logger_name)
         self.assertEqual(logger_instance.logger.level, logging.INFO)
 
-    def test_init_invalid_log_level(self):
-        with self.assertRaises(ValueError):
-            Logger(name=self.logger_name, log_level="invalid")
-
-    def test_init_invalid_file_log_level(self):
-        with self.assertRaises(ValueError):
-            Logger(name=self.logger_name, file_log_level="invalid")
+    def test_init_invalid_levels(self):
+        for kwargs in ({"log_level": "invalid"}, {"file_log_level": "invalid"}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    Logger(name=self.logger_name, **kwargs)
 
     def test_console_handler_setup(self):
         logger_instance = Logger(name=self.logger_name)
@@ -42,13 +66,42 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(len(handlers), 1)
         self.assertIsInstance(handlers[0], logging.StreamHandler)
 
+    def test_async_console_handler_setup(self):
+        logger_instance = Logger(name=self.logger_name, async_console=True)
+        handlers = logger_instance.logger.handlers
+        self.assertEqual(len(handlers), 1)
+        self.assertIsInstance(handlers[0], logging.handlers.QueueHandler)  # type: ignore
+        logger_instance.stop_async_console()
+
+    def test_async_console_contention(self):
+        logger_instance = Logger(name=self.logger_name, async_console=True)
+        # Capture the listener-side stream so the test does not spam stderr.
+        captured = io.StringIO()
+        logger_instance._console_listener.handlers[0].setStream(captured)
+        logger = logger_instance.get_logger()
+
+        def emit_messages():
+            for i in range(100):
+                logger.info("thread message %d", i)
+
+        threads = [threading.Thread(target=emit_messages) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Stopping drains the queue, so every record from every producer
+        # thread must have reached the console handler exactly once.
+        logger_instance.stop_async_console()
+        self.assertEqual(captured.getvalue().count("thread message"), 800)
+
     def test_file_handler_setup(self):
         logger_instance = Logger(
-            name=self.logger_name, log_file=self.temp_log_file.name
+            name=self.logger_name, log_file=self.temp_log_file_name
         )
         handlers = logger_instance.logger.handlers
         self.assertEqual(len(handlers), 2)  # Console + File
-        self.assertIsInstance(handlers[1], logging.FileHandler)
+        self.assertIsInstance(handlers[1], BufferedFileHandler)
+        self.assertEqual(handlers[1].BUFFER_SIZE, 64 * 1024)
 
     @patch("CnQuant_utilities.logger.SMTPHandler")
     def test_email_handler_setup(self, mock_smtp):
@@ -64,6 +117,32 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(len(handlers), 2)  # Console + Email
         mock_smtp.assert_called_once()
 
+    def test_fast_call_handlers_installed(self):
+        logger_instance = Logger(name=self.logger_name)
+        logger = logger_instance.get_logger()
+        # Propagation is off and the instance-level callHandlers snapshot is
+        # in place, so emits never walk the parent logger chain.
+        self.assertFalse(logger.propagate)
+        self.assertIn("callHandlers", logger.__dict__)
+
+    def test_handler_levels_floored_to_logger_level(self):
+        logger_instance = Logger(name=self.logger_name, log_level="critical")
+        for handler in logger_instance.logger.handlers:
+            self.assertGreaterEqual(handler.level, logger_instance.logger.level)
+
+    def test_disable_below(self):
+        self.addCleanup(logging.disable, logging.NOTSET)
+        logger_instance = Logger(name=self.logger_name, log_level="debug")
+        logger = logger_instance.get_logger()
+        Logger.disable_below(level="warning")
+        # Disabled calls short-circuit on a single integer compare.
+        self.assertFalse(logger.isEnabledFor(logging.DEBUG))
+        self.assertTrue(logger.isEnabledFor(logging.WARNING))
+        Logger.disable_below(level="none")
+        self.assertTrue(logger.isEnabledFor(logging.DEBUG))
+        with self.assertRaises(ValueError):
+            Logger.disable_below(level="invalid")
+
     def test_get_logger(self):
         logger_instance = Logger(name=self.logger_name)
         retrieved_logger = logger_instance.get_logger()
@@ -71,14 +150,23 @@ class TestLogger(unittest.TestCase):
 
 
 class TestAsyncLogger(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
     def setUp(self):
         self.logger_name = f"test_async_logger_{self._testMethodName}"
-        self.temp_log_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_log_file.close()
+        # Only a path; the file is first created when a handler opens it.
+        self.temp_log_file_name = str(
+            Path(self.tmpdir.name) / f"{self._testMethodName}.log"
+        )
 
     def tearDown(self):
-        if os.path.exists(self.temp_log_file.name):
-            os.unlink(self.temp_log_file.name)
+        Path(self.temp_log_file_name).unlink(missing_ok=True)
 
     def test_init_valid_levels(self):
         logger_instance = AsyncLogger(
@@ -87,9 +175,11 @@ class TestAsyncLogger(unittest.TestCase):
         self.assertEqual(logger_instance.logger.name, self.logger_name)
         self.assertEqual(logger_instance.logger.level, logging.INFO)
 
-    def test_init_invalid_log_level(self):
-        with self.assertRaises(ValueError):
-            AsyncLogger(name=self.logger_name, log_level="invalid")
+    def test_init_invalid_levels(self):
+        for kwargs in ({"log_level": "invalid"}, {"file_log_level": "invalid"}):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    AsyncLogger(name=self.logger_name, **kwargs)
 
     def test_console_handler_setup(self):
         logger_instance = AsyncLogger(name=self.logger_name)
@@ -99,7 +189,7 @@ class TestAsyncLogger(unittest.TestCase):
 
     def test_file_handler_setup(self):
         logger_instance = AsyncLogger(
-            name=self.logger_name, log_file=self.temp_log_file.name
+            name=self.logger_name, log_file=self.temp_log_file_name
         )
         handlers = logger_instance.logger.handlers
         self.assertEqual(len(handlers), 1)  # Only the QueueHandler is added to the logger
@@ -118,9 +208,19 @@ class TestAsyncLogger(unittest.TestCase):
         handlers = logger_instance.logger.handlers
         self.assertEqual(len(handlers), 2)  # Main QueueHandler + Email QueueHandler
         mock_smtp.assert_called_once()
+        # A burst of criticals reaches the SMTP handler only via the buffering
+        # MemoryHandler in the listener thread: nothing before the 50-record
+        # capacity is hit, everything once the queue is drained.
+        logger = logger_instance.get_logger()
+        for i in range(100):
+            logger.critical("critical burst %d", i)
+        logger_instance.stop_async_logging()
+        self.assertEqual(mock_smtp.return_value.handle.call_count, 100)
 
     def test_start_stop_async_logging(self):
-        logger_instance = AsyncLogger(name=self.logger_name)
+        logger_instance = AsyncLogger(
+            name=self.logger_name, log_file=self.temp_log_file_name
+        )
         logger_instance.start_async_logging()
         self.assertTrue(
             all(
@@ -130,6 +230,9 @@ class TestAsyncLogger(unittest.TestCase):
                 for listener in logger_instance.listeners
             )
         )
+        logger = logger_instance.get_logger()
+        for i in range(50):
+            logger.info("batch message %d", i)
         logger_instance.stop_async_logging()
         self.assertTrue(
             all(
@@ -141,6 +244,71 @@ class TestAsyncLogger(unittest.TestCase):
                 for listener in logger_instance.listeners
             )
         )
+        # All queued records must have been drained to the file before stop
+        # returned, regardless of how the listener batched them.
+        with open(self.temp_log_file_name) as log_file:
+            logged_lines = log_file.read().splitlines()
+        self.assertEqual(
+            sum("batch message" in line for line in logged_lines), 50
+        )
+
+    def test_queue_handler_prepares_args_eagerly(self):
+        logger_instance = AsyncLogger(
+            name=self.logger_name, log_file=self.temp_log_file_name
+        )
+        logger = logger_instance.get_logger()
+        payload = [1, 2, 3]
+        logger.info("payload is %s", payload)
+        payload.append(4)  # Mutation after the call must not leak into the log
+        logger_instance.stop_async_logging()
+        with open(self.temp_log_file_name) as log_file:
+            contents = log_file.read()
+        self.assertIn("payload is [1, 2, 3]", contents)
+
+    def test_copying_queue_handler_leaves_original_untouched(self):
+        record_queue = queue.SimpleQueue()
+        handler = CopyingFastQueueHandler(queue=record_queue)
+        record = logging.LogRecord(
+            name="test",
+            level=logging.CRITICAL,
+            pathname="",
+            lineno=0,
+            msg="payload is %s",
+            args=("x",),
+            exc_info=None,
+        )
+        handler.emit(record)
+        queued = record_queue.get_nowait()
+        # The queue receives its own merged copy; the original record stays
+        # unmerged so other handlers on the same logger can format it safely.
+        self.assertIsNot(queued, record)
+        self.assertEqual(queued.msg, "payload is x")
+        self.assertIsNone(queued.args)
+        self.assertEqual(record.msg, "payload is %s")
+        self.assertEqual(record.args, ("x",))
+
+    def test_default_queue_is_simplequeue(self):
+        logger_instance = AsyncLogger(name=self.logger_name)
+        self.assertIsInstance(logger_instance.queue, queue.SimpleQueue)
+
+    def test_queue_bounded_drops(self):
+        capacity = 8
+        logger_instance = AsyncLogger(
+            name=self.logger_name, queue_capacity=capacity
+        )
+        self.assertEqual(logger_instance.queue.maxsize, capacity)
+        # Stop the listener so nothing drains the queue while we overfill it.
+        logger_instance.stop_async_logging()
+        logger = logger_instance.get_logger()
+        for i in range(capacity + 1):
+            logger.info("flood message %d", i)
+        self.assertGreaterEqual(logger_instance.queue_handler._dropped, 1)
+        self.assertEqual(logger_instance.queue.qsize(), capacity)
+        # Stopping with the bounded queue still full must not raise: the
+        # sentinel enqueue evicts the oldest record instead of failing.
+        listener = logger_instance.listeners[0]
+        listener.enqueue_sentinel()
+        self.assertEqual(logger_instance.queue.qsize(), capacity)
 
     def test_get_logger(self):
         logger_instance = AsyncLogger(name=self.logger_name)
@@ -148,48 +316,137 @@ class TestAsyncLogger(unittest.TestCase):
         self.assertEqual(retrieved_logger, logger_instance.logger)
 
 
+class TestBatchHandlers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.temp_log_file_name = str(
+            Path(self.tmpdir.name) / f"{self._testMethodName}.log"
+        )
+
+    def test_buffered_handle_batch_writes_all_records(self):
+        handler = BufferedFileHandler(self.temp_log_file_name)
+        handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+        handler.handle_batch([make_record(f"batch line {i}") for i in range(10)])
+        handler.close()
+        with open(self.temp_log_file_name) as log_file:
+            lines = log_file.read().splitlines()
+        self.assertEqual(lines, [f"batch line {i}" for i in range(10)])
+
+    def test_buffered_handle_batch_bad_record_keeps_rest(self):
+        class ExplodingFormatter(logging.Formatter):
+            def format(self, record):
+                if record.getMessage() == "boom":
+                    raise ValueError("boom")
+                return super().format(record)
+
+        handler = BufferedFileHandler(self.temp_log_file_name)
+        handler.setFormatter(ExplodingFormatter(fmt="%(message)s"))
+        handler.handleError = MagicMock()
+        handler.handle_batch(
+            [make_record("before"), make_record("boom"), make_record("after")]
+        )
+        handler.close()
+        with open(self.temp_log_file_name) as log_file:
+            lines = log_file.read().splitlines()
+        # The failing record goes through handleError; its neighbours land.
+        self.assertEqual(lines, ["before", "after"])
+        handler.handleError.assert_called_once()
+
+    def test_rotating_handle_batch_single_write(self):
+        handler = BatchedRotatingFileHandler(
+            self.temp_log_file_name, maxBytes=1_000_000, backupCount=1
+        )
+        handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+        handler.handle_batch([make_record(f"batch line {i}") for i in range(10)])
+        handler.close()
+        with open(self.temp_log_file_name) as log_file:
+            lines = log_file.read().splitlines()
+        self.assertEqual(lines, [f"batch line {i}" for i in range(10)])
+
+    def test_rotating_handle_batch_rolls_over_near_limit(self):
+        handler = BatchedRotatingFileHandler(
+            self.temp_log_file_name, maxBytes=120, backupCount=10
+        )
+        handler.setFormatter(logging.Formatter(fmt="%(message)s"))
+        handler.handle_batch(
+            [make_record(f"a record long enough to matter {i}") for i in range(10)]
+        )
+        handler.close()
+        # The batch exceeds maxBytes, so the per-record fallback must have
+        # rotated at least once while keeping every record on disk.
+        self.assertTrue(Path(self.temp_log_file_name + ".1").exists())
+        logged = []
+        for suffix in [""] + [f".{i}" for i in range(1, 11)]:
+            rotated = Path(self.temp_log_file_name + suffix)
+            if rotated.exists():
+                logged += rotated.read_text().splitlines()
+        self.assertEqual(len(logged), 10)
+
+
 class TestFormatter(unittest.TestCase):
-    def test_format_info(self):
+    def test_format_levels(self):
         formatter = logging.Formatter(fmt="%(levelname)s - %(message)s")
+        for level, level_name in [
+            (logging.INFO, "INFO"),
+            (logging.WARNING, "WARNING"),
+            (logging.ERROR, "ERROR"),
+        ]:
+            with self.subTest(level_name=level_name):
+                record = logging.LogRecord(
+                    name="test",
+                    level=level,
+                    pathname="",
+                    lineno=0,
+                    msg="Test message",
+                    args=(),
+                    exc_info=None,
+                )
+                formatted = formatter.format(record)
+                self.assertIn(level_name, formatted)  # Check for level name
+
+    def test_fast_formatter_matches_stock(self):
+        fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(pathname)s:%(lineno)d"
+        stock = logging.Formatter(fmt=fmt, datefmt="%Y-%m-%d %H:%M:%S")
+        fast = FastFormatter(fmt=fmt, datefmt="%Y-%m-%d %H:%M:%S")
         record = logging.LogRecord(
             name="test",
             level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
+            pathname="/tmp/module.py",
+            lineno=42,
+            msg="Value is %d",
+            args=(7,),
             exc_info=None,
         )
-        formatted = formatter.format(record)
-        self.assertIn("INFO", formatted)  # Check for level name
+        self.assertEqual(fast.format(record), stock.format(record))
 
-    def test_format_warning(self):
-        formatter = logging.Formatter(fmt="%(levelname)s - %(message)s")
-        record = logging.LogRecord(
-            name="test",
-            level=logging.WARNING,
-            pathname="",
-            lineno=0,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-        formatted = formatter.format(record)
-        self.assertIn("WARNING", formatted)  # Check for level name
+    def test_fast_formatter_int_spec_matches_stock(self):
+        fmt = "%(created)d - %(message)s"
+        stock = logging.Formatter(fmt=fmt)
+        fast = FastFormatter(fmt=fmt)
+        record = make_record("Test message")
+        # %d must truncate float attributes like record.created, not str() them.
+        self.assertEqual(fast.format(record), stock.format(record))
 
-    def test_format_error(self):
-        formatter = logging.Formatter(fmt="%(levelname)s - %(message)s")
+    def test_fast_formatter_falls_back_on_unsupported_fmt(self):
+        fast = FastFormatter(fmt="%(message)s 100%%")
         record = logging.LogRecord(
             name="test",
-            level=logging.ERROR,
+            level=logging.INFO,
             pathname="",
             lineno=0,
-            msg="Test message",
+            msg="done",
             args=(),
             exc_info=None,
         )
-        formatted = formatter.format(record)
-        self.assertIn("ERROR", formatted)
+        self.assertIsNone(fast._ops)
+        self.assertEqual(fast.format(record), "done 100%")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file